@@ -7,22 +7,35 @@ from dotenv import load_dotenv
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Load environment variables from .env file
-env_path = Path(__file__).parent.parent.parent / ".env"
+root_dir = Path(__file__).parent.parent.parent
+env_path = root_dir / ".env"
 load_dotenv(env_path)
 
 # Get environment variables
 api_url = os.getenv("API_URL", "https://jsonplaceholder.typicode.com")
 debug_mode = os.getenv("DEBUG", "False").lower() == "true"
+changelog_size = int(os.getenv("CHANGELOG_SIZE", 10000))
+if changelog_size < 1:
+    raise ValueError(f"CHANGELOG_SIZE must be at least 1, got {changelog_size}")
+repository_backend = os.getenv("REPOSITORY", "api").lower()
+# Relative paths are resolved against the project root, not the working directory
+fixture_dir = str(root_dir / os.getenv("FIXTURE_DIR", "fixtures"))
+fixture_mode = os.getenv("FIXTURE_MODE", "replay").lower()
+sqlite_path = str(root_dir / os.getenv("SQLITE_PATH", "replica.db"))
+sqlite_pool_size = int(os.getenv("SQLITE_POOL_SIZE", 4))
 
 
 # ================================================================
 # Application Imports
 # ================================================================
-from fastapi import FastAPI
+from typing import Optional
+from fastapi import FastAPI, Query
 import uvicorn
 
 # import Repositories
 from core.repositories.jsonplaceholder_api import JsonplaceHolderRepository
+from core.repositories.jsonplaceholder_fixture import JsonplaceHolderFixtureRepository
+from core.repositories.jsonplaceholder_sqlite import JsonplaceHolderSqliteRepository
 
 # import Services
 from core.services.user_srv import UserService
@@ -35,19 +48,35 @@ from core.handlers.comment_res import CommentHandler
 from core.models.api_response import (
     ApiResponse,
     CommentApiResponse,
+    UserOverviewApiResponse,
+    UserChangesApiResponse,
+    CommentChangesApiResponse,
     HealthResponse,
 )
 
 # ================================================================
 # Repositories
 # ================================================================
-jsonplacehodelRepo = JsonplaceHolderRepository(api_url)
+if repository_backend == "fixture":
+    jsonplacehodelRepo = JsonplaceHolderFixtureRepository(
+        fixture_dir,
+        mode=fixture_mode,
+        upstream=JsonplaceHolderRepository(api_url) if fixture_mode == "record" else None,
+    )
+elif repository_backend == "sqlite":
+    jsonplacehodelRepo = JsonplaceHolderSqliteRepository(sqlite_path, poolSize=sqlite_pool_size)
+elif repository_backend == "api":
+    jsonplacehodelRepo = JsonplaceHolderRepository(api_url)
+else:
+    raise ValueError(
+        f"Unknown REPOSITORY: {repository_backend} (expected api, fixture or sqlite)"
+    )
 
 # ================================================================
 # Services
 # ================================================================
-userSrv = UserService(jsonplacehodelRepo)
-commentSrv = CommentService(jsonplacehodelRepo)
+userSrv = UserService(jsonplacehodelRepo, changelog_size)
+commentSrv = CommentService(jsonplacehodelRepo, changelog_size)
 
 # ================================================================
 # Handlers
@@ -77,6 +106,7 @@ app = FastAPI(
 @app.get(
     "/api/v1/users",
     response_model=ApiResponse,
+    response_model_exclude_none=True,
     summary="Get All Users",
     tags=["Users"],
     responses={
@@ -86,9 +116,68 @@ app = FastAPI(
         500: {"description": "Internal server error while fetching users"},
     },
 )
-async def get_users():
+async def get_users(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated fields to return (id is always included), "
+        "e.g. `name,email,address`. Available: id, name, username, email, "
+        "address, phone, website, company",
+    ),
+    skip: int = Query(0, ge=0, description="Number of users to skip"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of users to return"),
+):
     """Get all users from the JSONPlaceholder API."""
-    return userHand.get_all_users()
+    return userHand.get_all_users(fields, skip, limit)
+
+
+@app.get(
+    "/api/v1/users/overview",
+    response_model=UserOverviewApiResponse,
+    summary="Get Users Overview",
+    tags=["Users"],
+    responses={
+        200: {
+            "description": "Successfully retrieved users with their comment activity",
+        },
+        500: {"description": "Internal server error while building the overview"},
+    },
+)
+def get_users_overview(
+    latest: int = Query(3, ge=0, le=100, description="Number of latest comments per user"),
+):
+    """Get all users joined with their comment counts and latest comments.
+
+    Declared with plain `def` so FastAPI runs it in its threadpool; the
+    concurrent upstream fetches block that worker, not the event loop.
+    """
+    return userHand.get_users_overview(latest)
+
+
+@app.get(
+    "/api/v1/users/changes",
+    response_model=UserChangesApiResponse,
+    summary="Get User Changes",
+    tags=["Users"],
+    responses={
+        200: {
+            "description": "Users added, changed or removed since the given version "
+            "(code 410 in the body means the token is no longer valid; call again without `since`)",
+        },
+        500: {"description": "Internal server error while fetching user changes"},
+    },
+)
+def get_user_changes(
+    since: Optional[str] = Query(
+        None,
+        description="Version token from the previous response; omit to get the full snapshot as `added` entries",
+    ),
+):
+    """Get the user delta since a changelog version.
+
+    Declared with plain `def` so FastAPI runs the blocking upstream fetch and
+    diff in its threadpool instead of on the event loop.
+    """
+    return userHand.get_user_changes(since)
 
 
 @app.get(
@@ -103,9 +192,40 @@ async def get_users():
         500: {"description": "Internal server error while fetching comments"},
     },
 )
-async def get_comments():
+async def get_comments(
+    postId: Optional[int] = Query(None, description="Only return comments of this post"),
+    skip: int = Query(0, ge=0, description="Number of comments to skip"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of comments to return"),
+):
     """Get all comments from the JSONPlaceholder API."""
-    return commentHand.get_all_comment()
+    return commentHand.get_all_comment(postId, skip, limit)
+
+
+@app.get(
+    "/api/v1/comments/changes",
+    response_model=CommentChangesApiResponse,
+    summary="Get Comment Changes",
+    tags=["Comments"],
+    responses={
+        200: {
+            "description": "Comments added, changed or removed since the given version "
+            "(code 410 in the body means the token is no longer valid; call again without `since`)",
+        },
+        500: {"description": "Internal server error while fetching comment changes"},
+    },
+)
+def get_comment_changes(
+    since: Optional[str] = Query(
+        None,
+        description="Version token from the previous response; omit to get the full snapshot as `added` entries",
+    ),
+):
+    """Get the comment delta since a changelog version.
+
+    Declared with plain `def` so FastAPI runs the blocking upstream fetch and
+    diff in its threadpool instead of on the event loop.
+    """
+    return commentHand.get_comment_changes(since)
 
 
 # Health check endpoint
@@ -1,7 +1,104 @@
 import sys
+import os
+import time
 from pathlib import Path
+from dotenv import load_dotenv
 
 # Add root directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-print("start migration")
+# Load environment variables from .env file
+root_dir = Path(__file__).parent.parent.parent
+env_path = root_dir / ".env"
+load_dotenv(env_path)
+
+# Get environment variables
+api_url = os.getenv("API_URL", "https://jsonplaceholder.typicode.com")
+# Relative paths are resolved against the project root, not the working directory
+sqlite_path = str(root_dir / os.getenv("SQLITE_PATH", "replica.db"))
+batch_size = int(os.getenv("MIGRATION_BATCH_SIZE", 100))
+max_retries = int(os.getenv("MIGRATION_RETRIES", 3))
+
+if batch_size < 1:
+    raise ValueError(f"MIGRATION_BATCH_SIZE must be at least 1, got {batch_size}")
+if max_retries < 1:
+    raise ValueError(f"MIGRATION_RETRIES must be at least 1, got {max_retries}")
+
+
+# ================================================================
+# Application Imports
+# ================================================================
+import requests
+from core.models.repo_jsonplacehodel import RepoQuery
+
+# import Repositories
+from core.repositories.jsonplaceholder_api import JsonplaceHolderRepository
+from core.repositories.jsonplaceholder_sqlite import JsonplaceHolderSqliteRepository
+
+
+def migrate(fetch, upsert, label: str) -> set:
+    """Copy one collection from upstream into the replica in batches
+
+    Each batch is fetched with `_start` / `_limit` and written in its own
+    transaction. Stops at the first short (or empty) page. A failed page is
+    retried up to `max_retries` times; the source repository must be strict
+    so that a failure raises instead of looking like an empty page.
+
+    Args:
+        fetch: Repository method taking a RepoQuery
+        upsert: Replica method writing one batch
+        label: Collection name for logging
+
+    Returns:
+        IDs of every row fetched, used to prune rows deleted upstream
+
+    Raises:
+        requests.exceptions.RequestException, ValueError, KeyError: If a page still
+            fails after all retries
+    """
+    seen = set()
+    start = 0
+    while True:
+        for attempt in range(1, max_retries + 1):
+            try:
+                batch = fetch(RepoQuery(start=start, limit=batch_size))
+                break
+            except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+                if attempt == max_retries:
+                    raise
+                print(f"{label}: page at {start} failed ({e}), retry {attempt}/{max_retries - 1}")
+                time.sleep(attempt)
+        if batch:
+            upsert(batch)
+            seen.update(record.id for record in batch)
+            print(f"{label}: upserted {len(seen)} rows")
+        if len(batch) < batch_size:
+            return seen
+        start += batch_size
+
+
+# ================================================================
+# Application startup
+# ================================================================
+if __name__ == "__main__":
+    print("start migration")
+    started = time.time()
+
+    sourceRepo = JsonplaceHolderRepository(api_url, strict=True)
+    replicaRepo = JsonplaceHolderSqliteRepository(sqlite_path, poolSize=1)
+
+    try:
+        users = migrate(sourceRepo.get_users, replicaRepo.upsert_users, "users")
+        comments = migrate(sourceRepo.get_comments, replicaRepo.upsert_comments, "comments")
+    except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+        print(f"migration failed, replica is incomplete: {e}")
+        sys.exit(1)
+
+    # Both collections were fetched completely, so anything not seen was deleted upstream
+    pruned_users, pruned_comments = replicaRepo.prune_missing(users, comments)
+
+    print(
+        f"migration finished: {len(users)} users, {len(comments)} comments "
+        f"({pruned_users} users, {pruned_comments} comments removed) "
+        f"into {sqlite_path} in {time.time() - started:.2f}s"
+    )
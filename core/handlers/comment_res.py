@@ -1,3 +1,4 @@
+from typing import Optional
 from beartype import beartype
 from core.handlers.comment import commentHandler
 from core.services.comment_srv import CommentService
@@ -17,7 +18,12 @@ class CommentHandler(commentHandler):
         self.commentService = commentService
 
     @beartype
-    def get_all_comment(self) -> ResponseModel:
+    def get_all_comment(
+        self,
+        postId: Optional[int] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> ResponseModel:
         """Retrieve all users from the JSONPlaceholder API
 
         This endpoint fetches a complete list of all available users and returns them
@@ -27,6 +33,12 @@ class CommentHandler(commentHandler):
         - Returns all users from JSONPlaceholder API
         - Consistent response format with status codes
         - Error handling and informative messages
+        - Filtering and range pushed down to the repository
+
+        Args:
+            postId: Only return comments of this post
+            skip: Number of comments to skip
+            limit: Maximum number of comments to return
 
         Returns:
             ResponseModel: Response with status, code, message and user data
@@ -34,4 +46,16 @@ class CommentHandler(commentHandler):
         Raises:
             Exception: If service returns error
         """
-        return self.commentService.getAllComments()
+        return self.commentService.getAllComments(postId, skip, limit)
+
+    @beartype
+    def get_comment_changes(self, since: Optional[str] = None) -> ResponseModel:
+        """Retrieve comments added, changed or removed after a given version
+
+        Args:
+            since: Version token from the previous response, None to bootstrap
+
+        Returns:
+            ResponseModel: Response with the current version and the delta
+        """
+        return self.commentService.getCommentChanges(since)
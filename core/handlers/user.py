@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 from core.models.srv_global import ResponseModel
 
 
@@ -6,6 +7,21 @@ class userHandler(ABC):
     """Interface (Port) สำหรับ Repository ของ JsonplaceHolderAPI"""
 
     @abstractmethod
-    def get_all_users(self) -> ResponseModel:
+    def get_all_users(
+        self,
+        fields: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> ResponseModel:
         """ดึงข้อมูลผู้ใช้ทั้งหมด"""
         pass
+
+    @abstractmethod
+    def get_users_overview(self, latest: int = 3) -> ResponseModel:
+        """ดึงข้อมูลผู้ใช้พร้อมจำนวน comment และ comment ล่าสุด"""
+        pass
+
+    @abstractmethod
+    def get_user_changes(self, since: Optional[str] = None) -> ResponseModel:
+        """ดึงเฉพาะผู้ใช้ที่เปลี่ยนแปลงหลังจาก version ที่ระบุ"""
+        pass
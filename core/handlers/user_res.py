@@ -1,3 +1,4 @@
+from typing import Optional
 from beartype import beartype
 from core.handlers.user import userHandler
 from core.services.user_srv import UserService
@@ -17,7 +18,12 @@ class UserHandler(userHandler):
         self.userService = userService
 
     @beartype
-    def get_all_users(self) -> ResponseModel:
+    def get_all_users(
+        self,
+        fields: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> ResponseModel:
         """Retrieve all users from the JSONPlaceholder API
 
         This endpoint fetches a complete list of all available users and returns them
@@ -27,6 +33,12 @@ class UserHandler(userHandler):
         - Returns all users from JSONPlaceholder API
         - Consistent response format with status codes
         - Error handling and informative messages
+        - Sparse fieldsets via a comma-separated `fields` list
+
+        Args:
+            fields: Comma-separated field names to return, e.g. "name,address"
+            skip: Number of users to skip
+            limit: Maximum number of users to return
 
         Returns:
             ResponseModel: Response with status, code, message and user data
@@ -34,4 +46,33 @@ class UserHandler(userHandler):
         Raises:
             Exception: If service returns error
         """
-        return self.userService.getAllUser()
+        field_list = None
+        if fields:
+            field_list = [f.strip() for f in fields.split(",") if f.strip()]
+        return self.userService.getAllUser(field_list, skip, limit)
+
+    @beartype
+    def get_users_overview(self, latest: int = 3) -> ResponseModel:
+        """Retrieve every user with their comment count and latest comments
+
+        Users and comments are fetched concurrently and joined on email.
+
+        Args:
+            latest: Number of most recent comments to include per user
+
+        Returns:
+            ResponseModel: Response with status, code, message and overview data
+        """
+        return self.userService.getUsersOverview(latest)
+
+    @beartype
+    def get_user_changes(self, since: Optional[str] = None) -> ResponseModel:
+        """Retrieve users added, changed or removed after a given version
+
+        Args:
+            since: Version token from the previous response, None to bootstrap
+
+        Returns:
+            ResponseModel: Response with the current version and the delta
+        """
+        return self.userService.getUserChanges(since)
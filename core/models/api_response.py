@@ -1,15 +1,45 @@
 """API Response Models for Swagger/OpenAPI Documentation"""
 
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Literal, Optional
+
+
+class GeoSchema(BaseModel):
+    """Geographic coordinates of an address"""
+    lat: str = Field(..., description="Latitude")
+    lng: str = Field(..., description="Longitude")
+
+
+class AddressSchema(BaseModel):
+    """User postal address"""
+    street: str = Field(..., description="Street name")
+    suite: str = Field(..., description="Suite / apartment")
+    city: str = Field(..., description="City")
+    zipcode: str = Field(..., description="Postal code")
+    geo: GeoSchema = Field(..., description="Geographic coordinates")
+
+
+class CompanySchema(BaseModel):
+    """User company information"""
+    name: str = Field(..., description="Company name")
+    catchPhrase: str = Field(..., description="Company catch phrase")
+    bs: str = Field(..., description="Company business slogan")
 
 
 class UserSchema(BaseModel):
-    """User data model"""
+    """User data model
+
+    Only `id` is always present; the other fields are returned according to
+    the `fields` sparse fieldset query parameter.
+    """
     id: int = Field(..., description="User ID")
-    name: str = Field(..., description="User full name")
-    username: str = Field(..., description="User login username")
-    email: str = Field(..., description="User email address")
+    name: Optional[str] = Field(None, description="User full name")
+    username: Optional[str] = Field(None, description="User login username")
+    email: Optional[str] = Field(None, description="User email address")
+    address: Optional[AddressSchema] = Field(None, description="User postal address")
+    phone: Optional[str] = Field(None, description="User phone number")
+    website: Optional[str] = Field(None, description="User website")
+    company: Optional[CompanySchema] = Field(None, description="User company")
 
     class Config:
         json_schema_extra = {
@@ -133,6 +163,122 @@ class PaginatedResponse(BaseModel):
         }
 
 
+class UserOverviewSchema(BaseModel):
+    """User joined with their comment activity"""
+    id: int = Field(..., description="User ID")
+    name: str = Field(..., description="User full name")
+    username: str = Field(..., description="User login username")
+    email: str = Field(..., description="User email address")
+    commentCount: int = Field(..., description="Number of comments written with the user's email")
+    latestComments: List[CommentSchema] = Field(..., description="Most recent comments (highest ID first)")
+
+
+class UserOverviewApiResponse(BaseModel):
+    """API response wrapper for the users overview"""
+    status: bool = Field(..., description="Response status (success/failure)")
+    code: int = Field(..., description="HTTP status code")
+    message: str = Field(..., description="Response message or error description")
+    data: List[UserOverviewSchema] = Field(..., description="Users with comment activity")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": True,
+                "code": 200,
+                "message": "Users overview retrieved successfully",
+                "data": [
+                    {
+                        "id": 1,
+                        "name": "Leanne Graham",
+                        "username": "Bret",
+                        "email": "Sincere@april.biz",
+                        "commentCount": 1,
+                        "latestComments": [
+                            {
+                                "postId": 1,
+                                "id": 1,
+                                "name": "id labore ex et quam laborum",
+                                "email": "Sincere@april.biz",
+                                "body": "laudantium enim quasi est quidem magnam voluptate ipsam eos"
+                            }
+                        ]
+                    }
+                ]
+            }
+        }
+
+
+class UserChangeSchema(BaseModel):
+    """A single user changelog entry"""
+    version: int = Field(..., description="Changelog version of this entry")
+    op: Literal["added", "changed", "removed"] = Field(..., description="Change type")
+    id: int = Field(..., description="User ID")
+    data: Optional[UserSchema] = Field(None, description="User after the change, null when removed")
+
+
+class UserChangesSchema(BaseModel):
+    """User delta since a given version"""
+    version: str = Field(..., description="Current version token, pass as `since` next time")
+    changes: List[UserChangeSchema] = Field(..., description="Changes ordered by version")
+
+
+class UserChangesApiResponse(BaseModel):
+    """API response wrapper for the user changes feed"""
+    status: bool = Field(..., description="Response status (success/failure)")
+    code: int = Field(..., description="HTTP status code")
+    message: str = Field(..., description="Response message or error description")
+    data: Optional[UserChangesSchema] = Field(None, description="Delta since the requested version")
+
+
+class CommentChangeSchema(BaseModel):
+    """A single comment changelog entry"""
+    version: int = Field(..., description="Changelog version of this entry")
+    op: Literal["added", "changed", "removed"] = Field(..., description="Change type")
+    id: int = Field(..., description="Comment ID")
+    data: Optional[CommentSchema] = Field(None, description="Comment after the change, null when removed")
+
+
+class CommentChangesSchema(BaseModel):
+    """Comment delta since a given version"""
+    version: str = Field(..., description="Current version token, pass as `since` next time")
+    changes: List[CommentChangeSchema] = Field(..., description="Changes ordered by version")
+
+
+class CommentChangesApiResponse(BaseModel):
+    """API response wrapper for the comment changes feed"""
+    status: bool = Field(..., description="Response status (success/failure)")
+    code: int = Field(..., description="HTTP status code")
+    message: str = Field(..., description="Response message or error description")
+    data: Optional[CommentChangesSchema] = Field(None, description="Delta since the requested version")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": True,
+                "code": 200,
+                "message": "Changes retrieved successfully",
+                "data": {
+                    "version": "3f2a9c1e7b40.502",
+                    "changes": [
+                        {
+                            "version": 501,
+                            "op": "changed",
+                            "id": 1,
+                            "data": {
+                                "postId": 1,
+                                "id": 1,
+                                "name": "id labore ex et quam laborum",
+                                "email": "Eliseo@gardn.biz",
+                                "body": "laudantium enim quasi est quidem magnam voluptate ipsam eos"
+                            }
+                        },
+                        {"version": 502, "op": "removed", "id": 2, "data": None}
+                    ]
+                }
+            }
+        }
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str = Field(..., description="Health status")
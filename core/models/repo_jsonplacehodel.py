@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -43,3 +43,25 @@ class RepoCommentModel:
     name: str
     email: str
     body: str
+
+
+@dataclass
+class RepoQuery:
+    """Query spec passed to repository adapters
+
+    filters: field name -> value, or a list of accepted values
+    start / limit: range applied after filtering (like `_start` / `_limit`)
+    """
+    filters: Dict[str, Any] = field(default_factory=dict)
+    start: Optional[int] = None
+    limit: Optional[int] = None
+
+    def apply(self, records: List[Any]) -> List[Any]:
+        """Filter and slice records locally, for adapters that cannot push down"""
+        result = records
+        for name, value in self.filters.items():
+            accepted = value if isinstance(value, (list, tuple, set)) else [value]
+            result = [record for record in result if getattr(record, name, None) in accepted]
+        start = self.start or 0
+        end = start + self.limit if self.limit is not None else None
+        return result[start:end]
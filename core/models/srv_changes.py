@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class SrvChangeModel:
+    version: int
+    op: str  # "added" | "changed" | "removed"
+    id: int
+    data: any  # record after the change, None when removed
+
+
+@dataclass
+class SrvChangesModel:
+    version: str  # "<epoch>.<version>" token to pass as `since` next time
+    changes: List[SrvChangeModel]
@@ -1,9 +1,42 @@
 from dataclasses import dataclass
+from typing import List, Optional
+from core.models.repo_jsonplacehodel import Address, Company
+from core.models.srv_comment import SrvCommentModel
 
 
 @dataclass
 class User:
+    id: int
+    name: Optional[str] = None
+    username: Optional[str] = None
+    email: Optional[str] = None
+    address: Optional[Address] = None
+    phone: Optional[str] = None
+    website: Optional[str] = None
+    company: Optional[Company] = None
+
+
+@dataclass
+class UserOverview:
     id: int
     name: str
     username: str
     email: str
+    commentCount: int
+    latestComments: List[SrvCommentModel]
+
+
+# Fields returned when the client does not ask for a sparse fieldset
+DEFAULT_USER_FIELDS = ("id", "name", "username", "email")
+
+# Every field a client may request through `fields=`
+USER_FIELDS = (
+    "id",
+    "name",
+    "username",
+    "email",
+    "address",
+    "phone",
+    "website",
+    "company",
+)
@@ -1,17 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import List
-from core.models.repo_jsonplacehodel import User, RepoCommentModel
+from typing import List, Optional
+from core.models.repo_jsonplacehodel import User, RepoCommentModel, RepoQuery
 
 
 class jsonplaceHolderRepository(ABC):
     """Interface (Port) สำหรับ Repository ของ JsonplaceHolderAPI"""
 
     @abstractmethod
-    def get_users(self) -> List[User]:
-        """ดึงข้อมูลผู้ใช้ทั้งหมด"""
+    def get_users(self, query: Optional[RepoQuery] = None) -> List[User]:
+        """ดึงข้อมูลผู้ใช้ทั้งหมด หรือเฉพาะที่ตรงกับ query"""
         pass
 
     @abstractmethod
-    def get_comments(self) -> List[RepoCommentModel]:
-        """ดึงข้อมูลผู้ใช้ทั้งหมด"""
+    def get_comments(self, query: Optional[RepoQuery] = None) -> List[RepoCommentModel]:
+        """ดึงข้อมูล comment ทั้งหมด หรือเฉพาะที่ตรงกับ query"""
         pass
@@ -1,21 +1,96 @@
-from typing import List
+from typing import List, Optional, Tuple
 import requests
 from beartype import beartype
 from beartype.roar import BeartypeCallHintParamViolation
-from core.models.repo_jsonplacehodel import User, RepoCommentModel
+from core.models.repo_jsonplacehodel import (
+    User,
+    RepoCommentModel,
+    Address,
+    Geo,
+    Company,
+    RepoQuery,
+)
 from core.repositories.jsonplaceholder import jsonplaceHolderRepository
 
+# Top-level scalar fields the upstream can filter on via query parameters
+USER_QUERY_FIELDS = ("id", "name", "username", "email", "phone", "website")
+COMMENT_QUERY_FIELDS = ("postId", "id", "name", "email", "body")
+
+
+def map_user(user_data: dict) -> User:
+    """Map a raw JSONPlaceholder user payload to a User model"""
+    return User(
+        id=user_data.get("id"),
+        name=user_data.get("name"),
+        username=user_data.get("username"),
+        email=user_data.get("email"),
+        address=_map_address(user_data.get("address")),
+        phone=user_data.get("phone"),
+        website=user_data.get("website"),
+        company=_map_company(user_data.get("company")),
+    )
+
+
+def map_comment(comment_data: dict) -> RepoCommentModel:
+    """Map a raw JSONPlaceholder comment payload to a RepoCommentModel"""
+    return RepoCommentModel(
+        postId=comment_data.get("postId"),
+        id=comment_data.get("id"),
+        name=comment_data.get("name"),
+        email=comment_data.get("email"),
+        body=comment_data.get("body"),
+    )
+
+
+def _map_address(address_data: Optional[dict]) -> Optional[Address]:
+    """Map a raw address payload (including its geo) to an Address model"""
+    if not address_data:
+        return None
+    geo_data = address_data.get("geo") or {}
+    return Address(
+        street=address_data.get("street"),
+        suite=address_data.get("suite"),
+        city=address_data.get("city"),
+        zipcode=address_data.get("zipcode"),
+        geo=Geo(
+            lat=geo_data.get("lat"),
+            lng=geo_data.get("lng"),
+        ),
+    )
+
+
+def _map_company(company_data: Optional[dict]) -> Optional[Company]:
+    """Map a raw company payload to a Company model"""
+    if not company_data:
+        return None
+    return Company(
+        name=company_data.get("name"),
+        catchPhrase=company_data.get("catchPhrase"),
+        bs=company_data.get("bs"),
+    )
+
 
 class JsonplaceHolderRepository(jsonplaceHolderRepository):
     """Adapter that fetches data from JSONPlaceholder API"""
 
     @beartype
-    def __init__(self, url: str = "https://jsonplaceholder.typicode.com"):
+    def __init__(self, url: str = "https://jsonplaceholder.typicode.com", strict: bool = False):
+        """Initialize the API adapter
+
+        Args:
+            url: Base URL of the JSONPlaceholder API
+            strict: Re-raise fetch/parse errors instead of returning an empty
+                list, so batch jobs can tell a failure from an empty page
+        """
         self.url = url
+        self.strict = strict
 
     @beartype
-    def get_users(self) -> List[User]:
-        """Fetch all users from JSONPlaceholder API
+    def get_users(self, query: Optional[RepoQuery] = None) -> List[User]:
+        """Fetch users from JSONPlaceholder API
+
+        Args:
+            query: Optional filters/range, pushed down to the upstream when possible
 
         Returns:
             List of User objects
@@ -29,7 +104,8 @@ class JsonplaceHolderRepository(jsonplaceHolderRepository):
             # print(f"Fetching from: {endpoint}")
 
             # Make HTTP GET request
-            response = requests.get(endpoint, timeout=10)
+            params, residual = self._build_params(query, USER_QUERY_FIELDS)
+            response = requests.get(endpoint, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -39,32 +115,30 @@ class JsonplaceHolderRepository(jsonplaceHolderRepository):
             # Map API response to User models
             users = []
             for user_data in data:
-                user = User(
-                    id=user_data.get("id"),
-                    name=user_data.get("name"),
-                    username=user_data.get("username"),
-                    email=user_data.get("email"),
-                    address=user_data.get("address"),
-                    phone=user_data.get("phone"),
-                    website=user_data.get("website"),
-                    company=user_data.get("company"),
-                )
+                user = map_user(user_data)
                 users.append(user)
                 # print(f"User loaded: {user.name}")
 
             # print(f"Total users loaded: {len(users)}")
-            return users
+            return residual.apply(users) if residual else users
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching users: {e}")
+            if self.strict:
+                raise
             return []
         except (ValueError, KeyError) as e:
             print(f"Error processing user data: {e}")
+            if self.strict:
+                raise
             return []
 
     @beartype
-    def get_comments(self) -> List[RepoCommentModel]:
-        """Fetch all comments from JSONPlaceholder API
+    def get_comments(self, query: Optional[RepoQuery] = None) -> List[RepoCommentModel]:
+        """Fetch comments from JSONPlaceholder API
+
+        Args:
+            query: Optional filters/range, pushed down to the upstream when possible
 
         Returns:
             List of RepoCommentModel objects
@@ -78,7 +152,8 @@ class JsonplaceHolderRepository(jsonplaceHolderRepository):
             # print(f"Fetching from: {endpoint}")
 
             # Make HTTP GET request
-            response = requests.get(endpoint, timeout=10)
+            params, residual = self._build_params(query, COMMENT_QUERY_FIELDS)
+            response = requests.get(endpoint, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -88,22 +163,59 @@ class JsonplaceHolderRepository(jsonplaceHolderRepository):
             # Map API response to RepoCommentModel models
             comments = []
             for comment_data in data:
-                comment = RepoCommentModel(
-                    postId=comment_data.get("postId"),
-                    id=comment_data.get("id"),
-                    name=comment_data.get("name"),
-                    email=comment_data.get("email"),
-                    body=comment_data.get("body"),
-                )
+                comment = map_comment(comment_data)
                 comments.append(comment)
                 # print(f"Comment loaded: {comment.name}")
 
             # print(f"Total comments loaded: {len(comments)}")
-            return comments
+            return residual.apply(comments) if residual else comments
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching comments: {e}")
+            if self.strict:
+                raise
             return []
         except (ValueError, KeyError) as e:
             print(f"Error processing comments data: {e}")
+            if self.strict:
+                raise
             return []
+
+    @staticmethod
+    def _build_params(
+        query: Optional[RepoQuery], pushable: Tuple[str, ...]
+    ) -> Tuple[dict, Optional[RepoQuery]]:
+        """Translate a query spec into upstream query parameters
+
+        Filters on `pushable` fields become `field=value` parameters. Any other
+        filter is left in the returned residual query to be applied locally;
+        in that case the range is applied locally too, since slicing upstream
+        before the residual filter would drop matching rows. The upstream only
+        honours `_start` together with `_limit`, so a start without a limit is
+        also applied locally.
+
+        Returns:
+            (params, residual) where residual is None when fully pushed down
+        """
+        if query is None:
+            return {}, None
+
+        params = {}
+        residual_filters = {}
+        for name, value in query.filters.items():
+            if name in pushable:
+                params[name] = list(value) if isinstance(value, (list, tuple, set)) else value
+            else:
+                residual_filters[name] = value
+
+        if residual_filters:
+            return params, RepoQuery(
+                filters=residual_filters, start=query.start, limit=query.limit
+            )
+
+        if query.limit is None:
+            return params, RepoQuery(start=query.start) if query.start else None
+
+        params["_start"] = query.start or 0
+        params["_limit"] = query.limit
+        return params, None
@@ -0,0 +1,142 @@
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+from beartype import beartype
+from core.models.repo_jsonplacehodel import User, RepoCommentModel, RepoQuery
+from core.repositories.jsonplaceholder import jsonplaceHolderRepository
+from core.repositories.jsonplaceholder_api import map_user, map_comment
+
+FIXTURE_MODES = ("replay", "record")
+
+
+class JsonplaceHolderFixtureRepository(jsonplaceHolderRepository):
+    """Adapter that serves data from local fixture files
+
+    Fixtures are plain JSON files (`users.json`, `comments.json`) in the same
+    shape as the JSONPlaceholder API responses.
+
+    Modes:
+        replay: serve from the fixture files only, no network access. Files are
+            parsed once and kept in memory.
+        record: fetch from the `upstream` repository and write every successful
+            response to the fixture files, so it can be replayed later.
+    """
+
+    @beartype
+    def __init__(
+        self,
+        fixtureDir: str,
+        mode: str = "replay",
+        upstream: Optional[jsonplaceHolderRepository] = None,
+    ):
+        """Initialize the fixture repository
+
+        Args:
+            fixtureDir: Directory containing (or receiving) the fixture files
+            mode: "replay" or "record"
+            upstream: Repository to record from, required in record mode
+
+        Raises:
+            ValueError: If mode is unknown or record mode has no upstream
+        """
+        if mode not in FIXTURE_MODES:
+            raise ValueError(f"Unknown fixture mode: {mode}")
+        if mode == "record" and upstream is None:
+            raise ValueError("Record mode requires an upstream repository")
+
+        self.fixtureDir = Path(fixtureDir)
+        self.mode = mode
+        self.upstream = upstream
+        self._users: Optional[List[User]] = None
+        self._comments: Optional[List[RepoCommentModel]] = None
+
+    @beartype
+    def get_users(self, query: Optional[RepoQuery] = None) -> List[User]:
+        """Return users from the fixture (replay) or upstream (record)
+
+        Args:
+            query: Optional filters/range, applied locally in replay mode
+
+        Returns:
+            List of User objects
+        """
+        if self.mode == "record":
+            # Record the full collection so any query can be replayed later
+            users = self.upstream.get_users()
+            if users:
+                self._save("users.json", users)
+            return query.apply(users) if query else users
+
+        if self._users is None:
+            data = self._load("users.json")
+            if data is None:
+                return []
+            self._users = [map_user(user_data) for user_data in data]
+        return query.apply(self._users) if query else list(self._users)
+
+    @beartype
+    def get_comments(self, query: Optional[RepoQuery] = None) -> List[RepoCommentModel]:
+        """Return comments from the fixture (replay) or upstream (record)
+
+        Args:
+            query: Optional filters/range, applied locally in replay mode
+
+        Returns:
+            List of RepoCommentModel objects
+        """
+        if self.mode == "record":
+            # Record the full collection so any query can be replayed later
+            comments = self.upstream.get_comments()
+            if comments:
+                self._save("comments.json", comments)
+            return query.apply(comments) if query else comments
+
+        if self._comments is None:
+            data = self._load("comments.json")
+            if data is None:
+                return []
+            self._comments = [map_comment(comment_data) for comment_data in data]
+        return query.apply(self._comments) if query else list(self._comments)
+
+    def _load(self, name: str) -> Optional[list]:
+        """Read and parse a fixture file"""
+        path = self.fixtureDir / name
+        try:
+            with open(path, "rb") as f:
+                return json.load(f)
+        except OSError as e:
+            print(f"Error reading fixture {path}: {e}")
+            return None
+        except ValueError as e:
+            print(f"Error processing fixture {path}: {e}")
+            return None
+
+    def _save(self, name: str, records: list) -> None:
+        """Write records to a fixture file atomically
+
+        Each write goes to its own temp file in the fixture directory, so
+        concurrent requests in record mode never share or clobber a temp file;
+        the last `os.replace` wins.
+        """
+        path = self.fixtureDir / name
+        tmp_path = None
+        try:
+            self.fixtureDir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.fixtureDir,
+                prefix=f".{name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_path = f.name
+                json.dump([asdict(record) for record in records], f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing fixture {path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,333 @@
+import queue
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Tuple
+from beartype import beartype
+from core.models.repo_jsonplacehodel import (
+    User,
+    RepoCommentModel,
+    Address,
+    Geo,
+    Company,
+    RepoQuery,
+)
+from core.repositories.jsonplaceholder import jsonplaceHolderRepository
+
+# Filterable fields are shared with the API adapter so both push down the same
+# set; each maps 1:1 to a column here
+from core.repositories.jsonplaceholder_api import USER_QUERY_FIELDS, COMMENT_QUERY_FIELDS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    username TEXT,
+    email TEXT,
+    phone TEXT,
+    website TEXT,
+    address_street TEXT,
+    address_suite TEXT,
+    address_city TEXT,
+    address_zipcode TEXT,
+    address_geo_lat TEXT,
+    address_geo_lng TEXT,
+    company_name TEXT,
+    company_catchPhrase TEXT,
+    company_bs TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users (email);
+CREATE INDEX IF NOT EXISTS idx_users_username ON users (username);
+
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY,
+    postId INTEGER,
+    name TEXT,
+    email TEXT,
+    body TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_comments_postId ON comments (postId);
+CREATE INDEX IF NOT EXISTS idx_comments_email ON comments (email);
+"""
+
+USER_COLUMNS = (
+    "id",
+    "name",
+    "username",
+    "email",
+    "phone",
+    "website",
+    "address_street",
+    "address_suite",
+    "address_city",
+    "address_zipcode",
+    "address_geo_lat",
+    "address_geo_lng",
+    "company_name",
+    "company_catchPhrase",
+    "company_bs",
+)
+COMMENT_COLUMNS = ("id", "postId", "name", "email", "body")
+
+
+def _upsert_sql(table: str, columns: Tuple[str, ...]) -> str:
+    placeholders = ", ".join("?" for _ in columns)
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != "id")
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT(id) DO UPDATE SET {updates}"
+    )
+
+
+class JsonplaceHolderSqliteRepository(jsonplaceHolderRepository):
+    """Adapter that serves data from a local SQLite read replica
+
+    The replica is populated by `cmd/migration/app.py`. The database runs in
+    WAL mode so readers are not blocked while the migration writes, and reads
+    go through a small pool of long-lived connections.
+    """
+
+    @beartype
+    def __init__(self, path: str, poolSize: int = 4):
+        """Open the database and create the schema if needed
+
+        Args:
+            path: SQLite database file
+            poolSize: Number of pooled connections
+
+        Raises:
+            ValueError: If poolSize is below 1
+        """
+        if poolSize < 1:
+            raise ValueError(f"poolSize must be at least 1, got {poolSize}")
+        self.path = path
+        self.pool: queue.Queue = queue.Queue(maxsize=poolSize)
+        for _ in range(poolSize):
+            self.pool.put(self._connect())
+
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection from the pool"""
+        conn = self.pool.get()
+        try:
+            yield conn
+        finally:
+            self.pool.put(conn)
+
+    @beartype
+    def get_users(self, query: Optional[RepoQuery] = None) -> List[User]:
+        """Read users from the replica
+
+        Args:
+            query: Optional filters/range, translated to SQL when possible
+
+        Returns:
+            List of User objects
+        """
+        try:
+            sql, params, residual = self._build_select("users", query, USER_QUERY_FIELDS)
+            with self._connection() as conn:
+                rows = conn.execute(sql, params).fetchall()
+            users = [self._row_to_user(row) for row in rows]
+            return residual.apply(users) if residual else users
+        except sqlite3.Error as e:
+            print(f"Error reading users from replica: {e}")
+            return []
+
+    @beartype
+    def get_comments(self, query: Optional[RepoQuery] = None) -> List[RepoCommentModel]:
+        """Read comments from the replica
+
+        Args:
+            query: Optional filters/range, translated to SQL when possible
+
+        Returns:
+            List of RepoCommentModel objects
+        """
+        try:
+            sql, params, residual = self._build_select("comments", query, COMMENT_QUERY_FIELDS)
+            with self._connection() as conn:
+                rows = conn.execute(sql, params).fetchall()
+            comments = [
+                RepoCommentModel(
+                    postId=row["postId"],
+                    id=row["id"],
+                    name=row["name"],
+                    email=row["email"],
+                    body=row["body"],
+                )
+                for row in rows
+            ]
+            return residual.apply(comments) if residual else comments
+        except sqlite3.Error as e:
+            print(f"Error reading comments from replica: {e}")
+            return []
+
+    @beartype
+    def upsert_users(self, users: List[User]) -> int:
+        """Insert or update a batch of users in a single transaction
+
+        Returns:
+            Number of rows written
+        """
+        rows = [self._user_to_row(user) for user in users]
+        with self._connection() as conn:
+            with conn:
+                conn.executemany(_upsert_sql("users", USER_COLUMNS), rows)
+        return len(rows)
+
+    @beartype
+    def upsert_comments(self, comments: List[RepoCommentModel]) -> int:
+        """Insert or update a batch of comments in a single transaction
+
+        Returns:
+            Number of rows written
+        """
+        rows = [
+            (comment.id, comment.postId, comment.name, comment.email, comment.body)
+            for comment in comments
+        ]
+        with self._connection() as conn:
+            with conn:
+                conn.executemany(_upsert_sql("comments", COMMENT_COLUMNS), rows)
+        return len(rows)
+
+    @beartype
+    def prune_missing(self, userIds: Iterable[int], commentIds: Iterable[int]) -> Tuple[int, int]:
+        """Delete rows that were not seen in the latest full sync
+
+        Both tables are pruned in a single transaction, so readers never see
+        users pruned without their comments (or the other way round). Only
+        call this after both collections were fetched completely.
+
+        Args:
+            userIds: IDs of every user returned by the upstream
+            commentIds: IDs of every comment returned by the upstream
+
+        Returns:
+            (users deleted, comments deleted)
+        """
+        with self._connection() as conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen_users (id INTEGER PRIMARY KEY)")
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen_comments (id INTEGER PRIMARY KEY)")
+            try:
+                with conn:
+                    conn.execute("DELETE FROM seen_users")
+                    conn.execute("DELETE FROM seen_comments")
+                    conn.executemany("INSERT INTO seen_users (id) VALUES (?)", ((i,) for i in userIds))
+                    conn.executemany(
+                        "INSERT INTO seen_comments (id) VALUES (?)", ((i,) for i in commentIds)
+                    )
+                    users = conn.execute(
+                        "DELETE FROM users WHERE id NOT IN (SELECT id FROM seen_users)"
+                    ).rowcount
+                    comments = conn.execute(
+                        "DELETE FROM comments WHERE id NOT IN (SELECT id FROM seen_comments)"
+                    ).rowcount
+            finally:
+                conn.execute("DROP TABLE IF EXISTS temp.seen_users")
+                conn.execute("DROP TABLE IF EXISTS temp.seen_comments")
+        return users, comments
+
+    @staticmethod
+    def _build_select(
+        table: str, query: Optional[RepoQuery], pushable: Tuple[str, ...]
+    ) -> Tuple[str, list, Optional[RepoQuery]]:
+        """Translate a query spec into a SELECT statement
+
+        Mirrors the API adapter: filters on `pushable` fields become WHERE
+        clauses; anything else is returned as a residual query, in which case
+        the range is applied locally as well.
+
+        Returns:
+            (sql, params, residual) where residual is None when fully pushed down
+        """
+        sql = f"SELECT * FROM {table}"
+        params = []
+        if query is None:
+            return sql + " ORDER BY id", params, None
+
+        clauses = []
+        residual_filters = {}
+        for name, value in query.filters.items():
+            if name not in pushable:
+                residual_filters[name] = value
+                continue
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            clauses.append(f"{name} IN ({', '.join('?' for _ in values)})")
+            params.extend(values)
+
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id"
+
+        if residual_filters:
+            return sql, params, RepoQuery(
+                filters=residual_filters, start=query.start, limit=query.limit
+            )
+
+        if query.start is not None or query.limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([query.limit if query.limit is not None else -1, query.start or 0])
+        return sql, params, None
+
+    @staticmethod
+    def _user_to_row(user: User) -> tuple:
+        address = user.address
+        geo = address.geo if address else None
+        company = user.company
+        return (
+            user.id,
+            user.name,
+            user.username,
+            user.email,
+            user.phone,
+            user.website,
+            address.street if address else None,
+            address.suite if address else None,
+            address.city if address else None,
+            address.zipcode if address else None,
+            geo.lat if geo else None,
+            geo.lng if geo else None,
+            company.name if company else None,
+            company.catchPhrase if company else None,
+            company.bs if company else None,
+        )
+
+    @staticmethod
+    def _row_to_user(row: sqlite3.Row) -> User:
+        address = None
+        if row["address_street"] is not None:
+            address = Address(
+                street=row["address_street"],
+                suite=row["address_suite"],
+                city=row["address_city"],
+                zipcode=row["address_zipcode"],
+                geo=Geo(lat=row["address_geo_lat"], lng=row["address_geo_lng"]),
+            )
+        company = None
+        if row["company_name"] is not None:
+            company = Company(
+                name=row["company_name"],
+                catchPhrase=row["company_catchPhrase"],
+                bs=row["company_bs"],
+            )
+        return User(
+            id=row["id"],
+            name=row["name"],
+            username=row["username"],
+            email=row["email"],
+            address=address,
+            phone=row["phone"],
+            website=row["website"],
+            company=company,
+        )
@@ -0,0 +1,105 @@
+import uuid
+from collections import deque
+from threading import Lock
+from typing import Dict, List, Optional
+from beartype import beartype
+from core.models.srv_changes import SrvChangeModel, SrvChangesModel
+
+
+class ChangeLog:
+    """Bounded, versioned changelog built by diffing successive snapshots
+
+    Each call to `refresh` compares the new snapshot with the previous one and
+    appends one entry per added, changed or removed record. Every entry gets a
+    monotonically increasing version, so consumers can ask for everything
+    after the last version they have seen.
+
+    Versions only live in memory, so they are handed out as `<epoch>.<version>`
+    tokens where the epoch is unique per ChangeLog instance. A token from a
+    previous process (or a different instance) is rejected, which forces the
+    consumer to resync instead of silently missing changes.
+    """
+
+    @beartype
+    def __init__(self, maxlen: int = 10000):
+        """Initialize an empty changelog
+
+        Args:
+            maxlen: Maximum number of entries retained; older entries are dropped
+
+        Raises:
+            ValueError: If maxlen is below 1
+        """
+        if maxlen < 1:
+            raise ValueError(f"maxlen must be at least 1, got {maxlen}")
+        self.entries: deque = deque(maxlen=maxlen)
+        self.snapshot: Dict[int, object] = {}
+        self.epoch = uuid.uuid4().hex[:12]
+        self.version = 0
+        self.lock = Lock()
+
+    def refresh(self, records: List[object]) -> None:
+        """Diff a freshly fetched snapshot against the previous one
+
+        Args:
+            records: Current records, each with an `id` attribute
+        """
+        with self.lock:
+            current = {record.id: record for record in records}
+
+            for record_id, record in current.items():
+                previous = self.snapshot.get(record_id)
+                if previous is None:
+                    self._append("added", record_id, record)
+                elif previous != record:
+                    self._append("changed", record_id, record)
+
+            for record_id in self.snapshot.keys() - current.keys():
+                self._append("removed", record_id, None)
+
+            self.snapshot = current
+
+    def since(self, token: Optional[str] = None) -> Optional[SrvChangesModel]:
+        """Return the entries newer than the version in `token`
+
+        Without a token the whole current snapshot is returned as `added`
+        entries, regardless of how many entries the log retains, so a new
+        consumer can always bootstrap and then follow the returned token.
+
+        Args:
+            token: `<epoch>.<version>` token from a previous response, or None
+
+        Returns:
+            SrvChangesModel with the delta, or None if the token belongs to
+            another epoch, is ahead of the log, is malformed, or its entries
+            were already evicted; the consumer then has to bootstrap again
+        """
+        with self.lock:
+            if not token:
+                changes = [
+                    SrvChangeModel(version=self.version, op="added", id=record_id, data=record)
+                    for record_id, record in sorted(self.snapshot.items())
+                ]
+                return SrvChangesModel(version=self._token(), changes=changes)
+
+            epoch, _, raw_version = token.partition(".")
+            if epoch != self.epoch or not raw_version.isdigit():
+                return None
+            version = int(raw_version)
+            if version > self.version:
+                return None
+            # Entries after `version` must all still be retained
+            if version < self.version - len(self.entries):
+                return None
+
+            changes = [entry for entry in self.entries if entry.version > version]
+            return SrvChangesModel(version=self._token(), changes=changes)
+
+    def _token(self) -> str:
+        return f"{self.epoch}.{self.version}"
+
+    def _append(self, op: str, record_id: int, record: object) -> None:
+        self.version += 1
+        self.entries.append(
+            SrvChangeModel(version=self.version, op=op, id=record_id, data=record)
+        )
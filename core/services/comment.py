@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 from core.models.srv_global import ResponseModel
 
 
@@ -6,6 +7,16 @@ class commentService(ABC):
     """Interface (Port) สำหรับ Repository ของ JsonplaceHolderAPI"""
 
     @abstractmethod
-    def getAllComments(self) -> ResponseModel:
+    def getAllComments(
+        self,
+        postId: Optional[int] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> ResponseModel:
         """ดึงข้อมูลผู้ใช้ทั้งหมด"""
         pass
+
+    @abstractmethod
+    def getCommentChanges(self, since: Optional[str] = None) -> ResponseModel:
+        """ดึงเฉพาะ comment ที่เปลี่ยนแปลงหลังจาก version ที่ระบุ"""
+        pass
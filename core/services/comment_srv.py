@@ -1,7 +1,10 @@
+from typing import List, Optional
 from beartype import beartype
 from core.services.comment import commentService
+from core.services.changelog import ChangeLog
 from core.repositories.jsonplaceholder import jsonplaceHolderRepository
 from core.models.srv_comment import SrvCommentModel
+from core.models.repo_jsonplacehodel import RepoQuery
 from core.models.srv_global import ResponseModel
 
 
@@ -12,18 +15,31 @@ class CommentService(commentService):
     def __init__(
         self,
         jsonplaceHolderRepo: jsonplaceHolderRepository,
+        changelogSize: int = 10000,
     ):
         """Initialize UserService with repository dependency
 
         Args:
             userRepo: JSONPlaceholder repository for fetching user data
+            changelogSize: จำนวน change สูงสุดที่เก็บไว้สำหรับ changes feed
         """
         self.jsonplaceHolderRepo = jsonplaceHolderRepo
+        self.changelog = ChangeLog(changelogSize)
 
     @beartype
-    def getAllComments(self) -> ResponseModel:
+    def getAllComments(
+        self,
+        postId: Optional[int] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> ResponseModel:
         """ดึงข้อมูลผู้ใช้ทั้งหมดและคืนค่าเป็น ResponseModel
 
+        Args:
+            postId: กรองเฉพาะ comment ของ post นี้
+            skip: จำนวนรายการที่ข้าม
+            limit: จำนวนรายการสูงสุดที่ส่งกลับ
+
         Returns:
             ResponseModel: ข้อมูลผู้ใช้ทั้งหมดหรือข้อความ error
 
@@ -32,7 +48,12 @@ class CommentService(commentService):
         """
         try:
             # ดึงข้อมูลผู้ใช้จาก repository
-            comments = self.jsonplaceHolderRepo.get_comments()
+            query = RepoQuery(
+                filters={"postId": postId} if postId is not None else {},
+                start=skip or None,
+                limit=limit,
+            )
+            comments = self.jsonplaceHolderRepo.get_comments(query)
 
             # ตรวจสอบว่าได้ข้อมูลหรือไม่
             if not comments:
@@ -44,16 +65,7 @@ class CommentService(commentService):
                 )
 
             # Map repository-level User models to service-level User models
-            result_comments = []
-            for comment in comments:
-                newComment = SrvCommentModel(
-                    postId=comment.postId,
-                    id=comment.id,
-                    name=comment.name,
-                    email=comment.email,
-                    body=comment.body,
-                )
-                result_comments.append(newComment)
+            result_comments = self._map_comments(comments)
 
             return ResponseModel(
                 status=True,
@@ -70,3 +82,61 @@ class CommentService(commentService):
                 message=f"เกิดข้อผิดพลาด: {str(e)}",
                 data=[],
             )
+
+    @beartype
+    def getCommentChanges(self, since: Optional[str] = None) -> ResponseModel:
+        """ดึงเฉพาะ comment ที่เปลี่ยนแปลงหลังจาก version ที่ระบุ
+
+        ดึง snapshot ล่าสุดจาก repository แล้วเทียบกับ snapshot ก่อนหน้า
+        เพื่อบันทึก change (added / changed / removed) ลงใน changelog
+
+        Args:
+            since: version token จาก response ก่อนหน้า (ไม่ระบุ = ดึง snapshot ทั้งหมดเป็น added)
+
+        Returns:
+            ResponseModel: SrvChangesModel หรือ code 410 ถ้า token ใช้ไม่ได้แล้ว
+                ต้องเรียกใหม่โดยไม่ระบุ since
+        """
+        try:
+            comments = self.jsonplaceHolderRepo.get_comments()
+            if comments:
+                self.changelog.refresh(self._map_comments(comments))
+
+            changes = self.changelog.since(since)
+            if changes is None:
+                return ResponseModel(
+                    status=False,
+                    code=410,
+                    message="version ใช้ไม่ได้แล้ว กรุณาเรียกใหม่โดยไม่ระบุ since",
+                    data=None,
+                )
+
+            return ResponseModel(
+                status=True,
+                code=200,
+                message="ดึงข้อมูลการเปลี่ยนแปลงสำเร็จ",
+                data=changes,
+            )
+
+        except Exception as e:
+            print(f"Error fetching comment changes in service: {e}")
+            return ResponseModel(
+                status=False,
+                code=500,
+                message=f"เกิดข้อผิดพลาด: {str(e)}",
+                data=None,
+            )
+
+    @staticmethod
+    def _map_comments(comments: list) -> List[SrvCommentModel]:
+        """Map repository-level comment models to service-level comment models"""
+        return [
+            SrvCommentModel(
+                postId=comment.postId,
+                id=comment.id,
+                name=comment.name,
+                email=comment.email,
+                body=comment.body,
+            )
+            for comment in comments
+        ]
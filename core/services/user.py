@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional
 from core.models.srv_global import ResponseModel
 
 
@@ -6,6 +7,21 @@ class userService(ABC):
     """Interface (Port) สำหรับ Repository ของ JsonplaceHolderAPI"""
 
     @abstractmethod
-    def getAllUser(self) -> ResponseModel:
+    def getAllUser(
+        self,
+        fields: Optional[List[str]] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> ResponseModel:
         """ดึงข้อมูลผู้ใช้ทั้งหมด"""
         pass
+
+    @abstractmethod
+    def getUsersOverview(self, latest: int = 3) -> ResponseModel:
+        """ดึงข้อมูลผู้ใช้พร้อมจำนวน comment และ comment ล่าสุด"""
+        pass
+
+    @abstractmethod
+    def getUserChanges(self, since: Optional[str] = None) -> ResponseModel:
+        """ดึงเฉพาะผู้ใช้ที่เปลี่ยนแปลงหลังจาก version ที่ระบุ"""
+        pass
@@ -1,7 +1,14 @@
+import heapq
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from beartype import beartype
 from core.services.user import userService
+from core.services.changelog import ChangeLog
 from core.repositories.jsonplaceholder import jsonplaceHolderRepository
-from core.models.srv_user import User
+from core.models.srv_user import User, UserOverview, DEFAULT_USER_FIELDS, USER_FIELDS
+from core.models.srv_comment import SrvCommentModel
+from core.models.repo_jsonplacehodel import RepoQuery
 from core.models.srv_global import ResponseModel
 
 
@@ -12,27 +19,54 @@ class UserService(userService):
     def __init__(
         self,
         userRepo: jsonplaceHolderRepository,
+        changelogSize: int = 10000,
     ):
         """Initialize UserService with repository dependency
 
         Args:
             userRepo: JSONPlaceholder repository for fetching user data
+            changelogSize: จำนวน change สูงสุดที่เก็บไว้สำหรับ changes feed
         """
         self.userRepo = userRepo
+        self.changelog = ChangeLog(changelogSize)
 
     @beartype
-    def getAllUser(self) -> ResponseModel:
+    def getAllUser(
+        self,
+        fields: Optional[List[str]] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> ResponseModel:
         """ดึงข้อมูลผู้ใช้ทั้งหมดและคืนค่าเป็น ResponseModel
 
+        Args:
+            fields: รายชื่อ field ที่ต้องการ (sparse fieldset) ถ้าไม่ระบุจะใช้
+                id, name, username, email โดย id จะถูกส่งกลับเสมอ
+            skip: จำนวนรายการที่ข้าม
+            limit: จำนวนรายการสูงสุดที่ส่งกลับ
+
         Returns:
             ResponseModel: ข้อมูลผู้ใช้ทั้งหมดหรือข้อความ error
 
         Raises:
             BeartypeCallHintParamViolation: ถ้าคืนค่าไม่ใช่ ResponseModel
         """
+        # ตรวจสอบ field ที่ร้องขอก่อนเรียก repository
+        selected = set(fields) if fields else set(DEFAULT_USER_FIELDS)
+        unknown = selected - set(USER_FIELDS)
+        if unknown:
+            return ResponseModel(
+                status=False,
+                code=400,
+                message=f"ไม่รู้จัก field: {', '.join(sorted(unknown))}",
+                data=[],
+            )
+
         try:
             # ดึงข้อมูลผู้ใช้จาก repository
-            repo_users = self.userRepo.get_users()
+            repo_users = self.userRepo.get_users(
+                RepoQuery(start=skip or None, limit=limit)
+            )
 
             # ตรวจสอบว่าได้ข้อมูลหรือไม่
             if not repo_users:
@@ -43,15 +77,11 @@ class UserService(userService):
                     data=[],
                 )
 
-            # Map repository-level User models to service-level User models
+            # Map repository-level User models to service-level User models,
+            # copying only the requested fields
             service_users = []
             for repo_user in repo_users:
-                service_user = User(
-                    id=repo_user.id,
-                    name=repo_user.name,
-                    username=repo_user.username,
-                    email=repo_user.email,
-                )
+                service_user = self._map_user(repo_user, selected)
                 service_users.append(service_user)
 
             return ResponseModel(
@@ -70,6 +100,146 @@ class UserService(userService):
                 data=[],
             )
 
+    @beartype
+    def getUserChanges(self, since: Optional[str] = None) -> ResponseModel:
+        """ดึงเฉพาะผู้ใช้ที่เปลี่ยนแปลงหลังจาก version ที่ระบุ
+
+        ดึง snapshot ล่าสุดจาก repository แล้วเทียบกับ snapshot ก่อนหน้า
+        เพื่อบันทึก change (added / changed / removed) ลงใน changelog
+
+        Args:
+            since: version token จาก response ก่อนหน้า (ไม่ระบุ = ดึง snapshot ทั้งหมดเป็น added)
+
+        Returns:
+            ResponseModel: SrvChangesModel หรือ code 410 ถ้า token ใช้ไม่ได้แล้ว
+                ต้องเรียกใหม่โดยไม่ระบุ since
+        """
+        try:
+            repo_users = self.userRepo.get_users()
+            if repo_users:
+                self.changelog.refresh(
+                    [self._map_user(repo_user, USER_FIELDS) for repo_user in repo_users]
+                )
+
+            changes = self.changelog.since(since)
+            if changes is None:
+                return ResponseModel(
+                    status=False,
+                    code=410,
+                    message="version ใช้ไม่ได้แล้ว กรุณาเรียกใหม่โดยไม่ระบุ since",
+                    data=None,
+                )
+
+            return ResponseModel(
+                status=True,
+                code=200,
+                message="ดึงข้อมูลการเปลี่ยนแปลงสำเร็จ",
+                data=changes,
+            )
+
+        except Exception as e:
+            print(f"Error fetching user changes in service: {e}")
+            return ResponseModel(
+                status=False,
+                code=500,
+                message=f"เกิดข้อผิดพลาด: {str(e)}",
+                data=None,
+            )
+
+    @beartype
+    def getUsersOverview(self, latest: int = 3) -> ResponseModel:
+        """ดึงข้อมูลผู้ใช้พร้อมจำนวน comment และ comment ล่าสุดของแต่ละคน
+
+        ดึง users และ comments จาก repository พร้อมกัน (concurrent) แล้ว join
+        ด้วย hash join บน email ทำให้ latency ใกล้เคียงกับการดึงที่ช้าที่สุด
+        แทนที่จะเป็นผลรวมของทั้งสอง
+
+        หมายเหตุ: repository แบบไม่ strict คืนค่า [] เมื่อดึง comments ไม่สำเร็จ
+        ซึ่งแยกไม่ออกจากกรณีไม่มี comment เลย ในกรณีนี้จะยังคืน code 200
+        (commentCount เป็น 0 ทุกคน) แต่ log และ message จะระบุว่าเป็นผลลัพธ์บางส่วน
+
+        Args:
+            latest: จำนวน comment ล่าสุด (id มากที่สุด) ที่ส่งกลับต่อผู้ใช้
+
+        Returns:
+            ResponseModel: รายการ UserOverview หรือข้อความ error
+        """
+        try:
+            # ดึง users และ comments พร้อมกัน
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                users_future = executor.submit(self.userRepo.get_users)
+                comments_future = executor.submit(self.userRepo.get_comments)
+                repo_users = users_future.result()
+                comments = comments_future.result()
+
+            if not repo_users:
+                return ResponseModel(
+                    status=False,
+                    code=404,
+                    message="ไม่พบข้อมูลผู้ใช้",
+                    data=[],
+                )
+
+            message = "ดึงข้อมูลภาพรวมผู้ใช้สำเร็จ"
+            if not comments:
+                print("Users overview: no comments returned, result is partial")
+                message = "ดึงข้อมูลภาพรวมผู้ใช้สำเร็จบางส่วน (ไม่พบข้อมูล comment)"
+
+            # Build side: group comments by email (O(m))
+            comments_by_email = defaultdict(list)
+            for comment in comments:
+                if comment.email:
+                    comments_by_email[comment.email.casefold()].append(comment)
+
+            # Probe side: look up each user's comments (O(n))
+            overview = []
+            for repo_user in repo_users:
+                user_comments = comments_by_email.get((repo_user.email or "").casefold(), [])
+                latest_comments = heapq.nlargest(latest, user_comments, key=lambda c: c.id)
+                overview.append(
+                    UserOverview(
+                        id=repo_user.id,
+                        name=repo_user.name,
+                        username=repo_user.username,
+                        email=repo_user.email,
+                        commentCount=len(user_comments),
+                        latestComments=[
+                            SrvCommentModel(
+                                postId=comment.postId,
+                                id=comment.id,
+                                name=comment.name,
+                                email=comment.email,
+                                body=comment.body,
+                            )
+                            for comment in latest_comments
+                        ],
+                    )
+                )
+
+            return ResponseModel(
+                status=True,
+                code=200,
+                message=message,
+                data=overview,
+            )
+
+        except Exception as e:
+            print(f"Error fetching users overview in service: {e}")
+            return ResponseModel(
+                status=False,
+                code=500,
+                message=f"เกิดข้อผิดพลาด: {str(e)}",
+                data=[],
+            )
+
+    @staticmethod
+    def _map_user(repo_user, fields) -> User:
+        """Map a repository-level user to a service-level user with only `fields`"""
+        return User(
+            id=repo_user.id,
+            **{field: getattr(repo_user, field) for field in fields if field != "id"},
+        )
+
     @beartype
     def getAllComments(self) -> ResponseModel:
         """ดึงข้อมูลผู้ใช้ทั้งหมดและคืนค่าเป็น ResponseModel
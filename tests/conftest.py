@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+# Add root directory to Python path (appended so the top-level `cmd`
+# package does not shadow the standard library module used by pdb)
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+from core.models.repo_jsonplacehodel import (
+    Address,
+    Company,
+    Geo,
+    RepoCommentModel,
+    User,
+)
+from core.repositories.jsonplaceholder import jsonplaceHolderRepository
+
+
+class FakeRepository(jsonplaceHolderRepository):
+    """In-memory repository port used by service tests"""
+
+    def __init__(self, users, comments):
+        self.users = users
+        self.comments = comments
+
+    def get_users(self, query=None):
+        return query.apply(self.users) if query else list(self.users)
+
+    def get_comments(self, query=None):
+        return query.apply(self.comments) if query else list(self.comments)
+
+
+def make_user(id, email):
+    return User(
+        id=id,
+        name=f"User {id}",
+        username=f"user{id}",
+        email=email,
+        address=Address(
+            street="Kulas Light",
+            suite="Apt. 556",
+            city="Gwenborough",
+            zipcode="92998-3874",
+            geo=Geo(lat="-37.3159", lng="81.1496"),
+        ),
+        phone="1-770-736-8031",
+        website="hildegard.org",
+        company=Company(name="Romaguera-Crona", catchPhrase="Multi-layered", bs="harness"),
+    )
+
+
+def make_comment(id, email, postId=1):
+    return RepoCommentModel(postId=postId, id=id, name=f"c{id}", email=email, body="b")
+
+
+@pytest.fixture
+def fake_repo():
+    return FakeRepository(
+        users=[make_user(1, "Sincere@april.biz"), make_user(2, "Shanna@melissa.tv")],
+        comments=[
+            make_comment(1, "sincere@APRIL.biz"),
+            make_comment(5, "Sincere@april.biz"),
+            make_comment(3, "Sincere@april.biz"),
+            make_comment(4, "someone@else.org"),
+        ],
+    )
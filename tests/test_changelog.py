@@ -0,0 +1,78 @@
+import pytest
+from core.models.srv_comment import SrvCommentModel
+from core.services.changelog import ChangeLog
+
+
+def comment(id, body="x"):
+    return SrvCommentModel(postId=1, id=id, name="n", email="e", body=body)
+
+
+def test_refresh_records_added_changed_removed():
+    log = ChangeLog()
+    log.refresh([comment(1), comment(2)])
+    token = log.since().version
+
+    log.refresh([comment(1, body="changed"), comment(3)])
+    delta = log.since(token)
+
+    assert [(c.op, c.id) for c in delta.changes] == [
+        ("changed", 1),
+        ("added", 3),
+        ("removed", 2),
+    ]
+    assert log.since(delta.version).changes == []
+
+
+def test_bootstrap_returns_full_snapshot_even_when_log_is_smaller():
+    log = ChangeLog(maxlen=3)
+    log.refresh([comment(i) for i in range(1, 10)])
+
+    bootstrap = log.since()
+
+    assert [c.id for c in bootstrap.changes] == list(range(1, 10))
+    assert all(c.op == "added" for c in bootstrap.changes)
+    assert log.since(bootstrap.version).changes == []
+
+
+def test_evicted_version_is_rejected():
+    log = ChangeLog(maxlen=3)
+    log.refresh([comment(1), comment(2)])
+    token = log.since().version
+
+    log.refresh([comment(i) for i in range(1, 8)])
+
+    assert log.since(token) is None
+
+
+def test_version_ahead_of_log_is_rejected():
+    log = ChangeLog()
+    log.refresh([comment(1), comment(2), comment(3)])
+
+    assert log.since(f"{log.epoch}.5") is None
+
+
+def test_token_from_another_epoch_is_rejected():
+    old = ChangeLog()
+    old.refresh([comment(1)])
+    token = old.since().version
+
+    restarted = ChangeLog()
+    restarted.refresh([comment(1), comment(2)])
+
+    assert restarted.since(token) is None
+    assert restarted.since("garbage") is None
+
+
+def test_oldest_retained_version_boundary():
+    log = ChangeLog(maxlen=2)
+    log.refresh([comment(1)])
+    log.refresh([comment(1), comment(2)])
+    log.refresh([comment(1), comment(2), comment(3)])
+
+    assert [c.id for c in log.since(f"{log.epoch}.1").changes] == [2, 3]
+    assert log.since(f"{log.epoch}.0") is None
+
+
+def test_maxlen_below_one_is_rejected():
+    with pytest.raises(ValueError):
+        ChangeLog(maxlen=0)
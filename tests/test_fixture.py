@@ -0,0 +1,42 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from conftest import FakeRepository, make_comment, make_user
+from core.models.repo_jsonplacehodel import RepoQuery
+from core.repositories.jsonplaceholder_fixture import JsonplaceHolderFixtureRepository
+
+
+def test_record_then_replay_round_trip(tmp_path):
+    users = [make_user(1, "a@x"), make_user(2, "b@x")]
+    comments = [make_comment(1, "a@x", postId=1), make_comment(2, "b@x", postId=2)]
+    recorder = JsonplaceHolderFixtureRepository(
+        str(tmp_path), mode="record", upstream=FakeRepository(users, comments)
+    )
+    recorder.get_users()
+    recorder.get_comments()
+
+    replay = JsonplaceHolderFixtureRepository(str(tmp_path))
+
+    assert replay.get_users() == users
+    assert replay.get_comments() == comments
+    assert replay.get_comments(RepoQuery(filters={"postId": 2})) == comments[1:]
+
+
+def test_replay_with_missing_fixture_returns_empty(tmp_path):
+    replay = JsonplaceHolderFixtureRepository(str(tmp_path))
+
+    assert replay.get_users() == []
+    assert replay.get_comments() == []
+
+
+def test_concurrent_record_writes_do_not_collide(tmp_path, capsys):
+    users = [make_user(i, f"{i}@x") for i in range(1, 50)]
+    recorder = JsonplaceHolderFixtureRepository(
+        str(tmp_path), mode="record", upstream=FakeRepository(users, [])
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: recorder.get_users(), range(32)))
+
+    assert "Error writing fixture" not in capsys.readouterr().out
+    assert len(json.loads((tmp_path / "users.json").read_text())) == 49
+    assert [p.name for p in tmp_path.iterdir()] == ["users.json"]
@@ -0,0 +1,53 @@
+from core.models.repo_jsonplacehodel import RepoCommentModel, RepoQuery
+from core.repositories.jsonplaceholder_api import (
+    COMMENT_QUERY_FIELDS,
+    JsonplaceHolderRepository,
+)
+
+
+def comments():
+    return [
+        RepoCommentModel(postId=i // 3 + 1, id=i, name="n", email="e", body="b")
+        for i in range(1, 10)
+    ]
+
+
+def test_apply_filters_then_slices():
+    query = RepoQuery(filters={"postId": [2, 3]}, start=1, limit=2)
+
+    assert [c.id for c in query.apply(comments())] == [4, 5]
+
+
+def test_apply_start_without_limit():
+    assert [c.id for c in RepoQuery(start=7).apply(comments())] == [8, 9]
+
+
+def test_build_params_pushes_down_filters_and_range():
+    query = RepoQuery(filters={"postId": 2, "id": [4, 5]}, start=1, limit=1)
+
+    params, residual = JsonplaceHolderRepository._build_params(query, COMMENT_QUERY_FIELDS)
+
+    assert params == {"postId": 2, "id": [4, 5], "_start": 1, "_limit": 1}
+    assert residual is None
+
+
+def test_build_params_keeps_unpushable_filter_and_range_local():
+    query = RepoQuery(filters={"postId": 2, "unknown": "x"}, start=1, limit=1)
+
+    params, residual = JsonplaceHolderRepository._build_params(query, COMMENT_QUERY_FIELDS)
+
+    assert params == {"postId": 2}
+    assert residual == RepoQuery(filters={"unknown": "x"}, start=1, limit=1)
+
+
+def test_build_params_start_without_limit_is_applied_locally():
+    params, residual = JsonplaceHolderRepository._build_params(
+        RepoQuery(start=10), COMMENT_QUERY_FIELDS
+    )
+
+    assert params == {}
+    assert residual == RepoQuery(start=10)
+
+
+def test_build_params_without_query():
+    assert JsonplaceHolderRepository._build_params(None, COMMENT_QUERY_FIELDS) == ({}, None)
@@ -0,0 +1,63 @@
+import pytest
+from conftest import make_comment, make_user
+from core.models.repo_jsonplacehodel import RepoCommentModel, RepoQuery
+from core.repositories.jsonplaceholder_sqlite import (
+    COMMENT_QUERY_FIELDS,
+    JsonplaceHolderSqliteRepository,
+)
+
+
+def test_build_select_pushes_down_filters_and_range():
+    query = RepoQuery(filters={"postId": [2, 3]}, start=1, limit=2)
+
+    sql, params, residual = JsonplaceHolderSqliteRepository._build_select(
+        "comments", query, COMMENT_QUERY_FIELDS
+    )
+
+    assert sql == "SELECT * FROM comments WHERE postId IN (?, ?) ORDER BY id LIMIT ? OFFSET ?"
+    assert params == [2, 3, 2, 1]
+    assert residual is None
+
+
+def test_build_select_keeps_unpushable_filter_and_range_local():
+    query = RepoQuery(filters={"unknown": "x"}, start=1, limit=2)
+
+    sql, params, residual = JsonplaceHolderSqliteRepository._build_select(
+        "comments", query, COMMENT_QUERY_FIELDS
+    )
+
+    assert sql == "SELECT * FROM comments ORDER BY id"
+    assert params == []
+    assert residual == query
+
+
+def test_upsert_and_query(tmp_path):
+    repo = JsonplaceHolderSqliteRepository(str(tmp_path / "replica.db"), poolSize=1)
+    repo.upsert_comments(
+        [RepoCommentModel(postId=i // 3 + 1, id=i, name="n", email="e", body="b") for i in range(1, 10)]
+    )
+    repo.upsert_comments([RepoCommentModel(postId=2, id=4, name="n", email="e", body="updated")])
+
+    result = repo.get_comments(RepoQuery(filters={"postId": 2}, start=1))
+
+    assert [(c.id, c.body) for c in result] == [(4, "updated"), (5, "b")]
+
+
+def test_pool_size_below_one_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        JsonplaceHolderSqliteRepository(str(tmp_path / "replica.db"), poolSize=0)
+
+
+def test_prune_missing_removes_rows_deleted_upstream(tmp_path):
+    repo = JsonplaceHolderSqliteRepository(str(tmp_path / "replica.db"), poolSize=1)
+    repo.upsert_users([make_user(i, f"{i}@x") for i in (1, 2, 3)])
+    repo.upsert_comments([make_comment(i, "e") for i in (1, 2, 3)])
+
+    # Next run: user 2 and comment 3 are gone upstream
+    repo.upsert_users([make_user(i, f"{i}@x") for i in (1, 3)])
+    repo.upsert_comments([make_comment(i, "e") for i in (1, 2)])
+    pruned = repo.prune_missing({1, 3}, {1, 2})
+
+    assert pruned == (1, 1)
+    assert [u.id for u in repo.get_users()] == [1, 3]
+    assert [c.id for c in repo.get_comments()] == [1, 2]
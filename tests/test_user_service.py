@@ -0,0 +1,48 @@
+from dataclasses import asdict
+from core.models.api_response import ApiResponse
+from core.services.user_srv import UserService
+
+
+def serialize(response):
+    """Validate and dump the way FastAPI does with response_model_exclude_none"""
+    return ApiResponse.model_validate(asdict(response)).model_dump(exclude_none=True)
+
+
+def test_unknown_field_is_rejected(fake_repo):
+    response = UserService(fake_repo).getAllUser(["name", "password"])
+
+    assert response.code == 400
+    assert "password" in response.message
+
+
+def test_default_fieldset(fake_repo):
+    data = serialize(UserService(fake_repo).getAllUser())["data"]
+
+    assert data[0] == {
+        "id": 1,
+        "name": "User 1",
+        "username": "user1",
+        "email": "Sincere@april.biz",
+    }
+
+
+def test_id_only_fieldset(fake_repo):
+    data = serialize(UserService(fake_repo).getAllUser(["id"]))["data"]
+
+    assert data == [{"id": 1}, {"id": 2}]
+
+
+def test_nested_address_and_company_are_serialized(fake_repo):
+    data = serialize(UserService(fake_repo).getAllUser(["address", "company"]))["data"]
+
+    assert data[0] == {
+        "id": 1,
+        "address": {
+            "street": "Kulas Light",
+            "suite": "Apt. 556",
+            "city": "Gwenborough",
+            "zipcode": "92998-3874",
+            "geo": {"lat": "-37.3159", "lng": "81.1496"},
+        },
+        "company": {"name": "Romaguera-Crona", "catchPhrase": "Multi-layered", "bs": "harness"},
+    }
@@ -0,0 +1,30 @@
+from conftest import FakeRepository, make_user
+from core.services.user_srv import UserService
+
+
+def test_join_matches_email_case_insensitively_and_orders_latest(fake_repo):
+    response = UserService(fake_repo).getUsersOverview(latest=2)
+
+    first, second = response.data
+    assert response.code == 200
+    assert first.commentCount == 3
+    assert [c.id for c in first.latestComments] == [5, 3]
+    assert second.commentCount == 0
+    assert second.latestComments == []
+
+
+def test_latest_zero_keeps_counts(fake_repo):
+    response = UserService(fake_repo).getUsersOverview(latest=0)
+
+    assert [u.commentCount for u in response.data] == [3, 0]
+    assert all(u.latestComments == [] for u in response.data)
+
+
+def test_missing_comments_is_reported_as_partial(capsys):
+    repo = FakeRepository(users=[make_user(1, "a@x")], comments=[])
+
+    response = UserService(repo).getUsersOverview()
+
+    assert response.code == 200
+    assert "บางส่วน" in response.message
+    assert "partial" in capsys.readouterr().out